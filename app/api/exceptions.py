@@ -1,30 +1,40 @@
 import logging
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import Request, Response, status
 from sqlalchemy.exc import SQLAlchemyError
 
 logger = logging.getLogger(__name__)
 
+# Error bodies never change, so encode them once instead of on every failure
+_DATABASE_ERROR_BODY: bytes = orjson.dumps(
+    {
+        "detail": "A database error occurred. Please try again later.",
+        "type": "database_error",
+    }
+)
+_INTERNAL_ERROR_BODY: bytes = orjson.dumps(
+    {
+        "detail": "An unexpected error occurred. Please try again later.",
+        "type": "internal_server_error",
+    }
+)
+
 
 async def sqlalchemy_exception_handler(
     request: Request, exc: SQLAlchemyError
-) -> JSONResponse:
-    logger.error(f"Database error on {request.url.path}: {exc}", exc_info=True)
-    return JSONResponse(
+) -> Response:
+    logger.error("Database error on %s: %s", request.url.path, exc, exc_info=True)
+    return Response(
+        content=_DATABASE_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "detail": "A database error occurred. Please try again later.",
-            "type": "database_error",
-        },
+        media_type="application/json",
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    logger.error(f"Unexpected error on {request.url.path}: {exc}", exc_info=True)
-    return JSONResponse(
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
+    logger.error("Unexpected error on %s: %s", request.url.path, exc, exc_info=True)
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "detail": "An unexpected error occurred. Please try again later.",
-            "type": "internal_server_error",
-        },
+        media_type="application/json",
     )
@@ -1,15 +1,22 @@
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
+import time
+from collections.abc import Awaitable, Callable
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config.db_settings import get_db
+from app.config.db_settings import DBSession
+from app.config.env_settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["health"])
 
+# Per-process cache of health payloads: key -> (monotonic timestamp, payload)
+_cache: dict[str, tuple[float, dict]] = {}
+
 
 class HealthResponse(BaseModel):
     status: str = "healthy"
@@ -20,14 +27,68 @@ class HealthDetailResponse(HealthResponse):
     database: str = "connected"
 
 
+async def _cached(
+    ttl: int, key: str, fn: Callable[[], Awaitable[BaseModel]]
+) -> ORJSONResponse:
+    """Return a cached health payload, recomputing it once the TTL expires.
+
+    Args:
+        ttl: Seconds a payload stays fresh
+        key: Cache key for the endpoint
+        fn: Coroutine factory producing a fresh payload
+
+    Returns:
+        JSON response with X-Cache and a Cache-Control max-age capped at the
+        entry's remaining lifetime
+    """
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry is not None and now - entry[0] < ttl:
+        cache_status = "HIT"
+        payload = entry[1]
+        # Only the entry's remaining lifetime, so downstream caches never hold
+        # it past the point where this process would recompute it
+        max_age = max(0, ttl - int(now - entry[0]))
+    else:
+        cache_status = "MISS"
+        payload = (await fn()).model_dump()
+        _cache[key] = (now, payload)
+        max_age = ttl
+
+    return ORJSONResponse(
+        content=payload,
+        headers={"Cache-Control": f"max-age={max_age}", "X-Cache": cache_status},
+    )
+
+
+async def _check_database(db: AsyncSession) -> HealthDetailResponse:
+    try:
+        await db.execute(text("SELECT 1"))
+    except Exception as e:
+        logger.error("Database health check failed: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="API is running but database connection failed",
+        )
+
+    return HealthDetailResponse(
+        status="healthy",
+        message="API and database are running",
+        database="connected",
+    )
+
+
 @router.get(
     "/health",
     response_model=HealthResponse,
     summary="Health check",
     description="Basic health check endpoint to verify API is running",
 )
-def health_check() -> HealthResponse:
-    return HealthResponse(status="healthy", message="API is running")
+async def health_check() -> ORJSONResponse:
+    async def check() -> HealthResponse:
+        return HealthResponse(status="healthy", message="API is running")
+
+    return await _cached(get_settings().HEALTH_CACHE_TTL, "basic", check)
 
 
 @router.get(
@@ -36,21 +97,7 @@ def health_check() -> HealthResponse:
     summary="Detailed health check",
     description="Detailed health check that verifies database connectivity",
 )
-def detailed_health_check(db: Session = Depends(get_db)) -> HealthDetailResponse:
-    try:
-        db.execute(text("SELECT 1"))
-        db_status = "connected"
-        message = "API and database are running"
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        message = "API is running but database connection failed"
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=message,
-        )
-
-    return HealthDetailResponse(
-        status="healthy",
-        message=message,
-        database=db_status,
+async def detailed_health_check(db: DBSession) -> ORJSONResponse:
+    return await _cached(
+        get_settings().HEALTH_CACHE_TTL, "detailed", lambda: _check_database(db)
     )
@@ -1,18 +1,40 @@
+import hashlib
+from datetime import datetime
 from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from app.config.db_settings import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from app.config.db_settings import DBSession
 from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MIN_PAGE_SIZE
 from app.repositories.notes_repository import NotesRepository
-from app.schemas.note import NoteCreate, NoteUpdate, NoteFullUpdate, NoteResponse
+from app.schemas.note import (
+    NoteCreate,
+    NoteUpdate,
+    NoteFullUpdate,
+    NoteResponse,
+)
 
 router = APIRouter(prefix="/notes", tags=["notes"])
 
 
-def get_notes_repo(db: Session = Depends(get_db)) -> NotesRepository:
+def get_notes_repo(db: DBSession) -> NotesRepository:
     return NotesRepository(db)
 
 
+def _make_etag(data: bytes) -> str:
+    # Weak, since GZipMiddleware may serve a different encoding of the same body
+    return f'W/"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+
+
+def _timestamp(value: datetime | None) -> float | None:
+    return value.timestamp() if value else None
+
+
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
 @router.post(
     "/",
     response_model=NoteResponse,
@@ -20,20 +42,21 @@ def get_notes_repo(db: Session = Depends(get_db)) -> NotesRepository:
     summary="Create a new note",
     description="Create a new note with title and content",
 )
-def create_note(
+async def create_note(
     note_data: NoteCreate,
     repo: NotesRepository = Depends(get_notes_repo),
 ) -> NoteResponse:
-    return repo.create(note_data)
+    return await repo.create(note_data)
 
 
 @router.get(
     "/",
-    response_model=list[NoteResponse],
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": list[NoteResponse]}},
     summary="List all notes",
     description="Get a paginated list of all notes",
 )
-def list_notes(
+async def list_notes(
     skip: Annotated[int, Query(ge=0, description="Number of records to skip")] = 0,
     limit: Annotated[
         int,
@@ -41,22 +64,39 @@ def list_notes(
             ge=MIN_PAGE_SIZE, le=MAX_PAGE_SIZE, description="Maximum number of records"
         ),
     ] = DEFAULT_PAGE_SIZE,
+    if_none_match: Annotated[str | None, Header()] = None,
     repo: NotesRepository = Depends(get_notes_repo),
-) -> list[NoteResponse]:
-    return repo.get_all(skip=skip, limit=limit)
+) -> Response:
+    # The repository encodes rows straight into JSON bytes, skipping FastAPI's
+    # per-response validation and encoding; the page itself is the ETag source
+    content = await repo.get_all_json(skip=skip, limit=limit)
+    etag = _make_etag(content)
+
+    if _etag_matches(etag, if_none_match):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @router.get(
     "/{note_id}",
-    response_model=NoteResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": NoteResponse}},
     summary="Get a note by ID",
     description="Retrieve a specific note by its ID",
 )
-def get_note(
+async def get_note(
     note_id: int,
+    if_none_match: Annotated[str | None, Header()] = None,
     repo: NotesRepository = Depends(get_notes_repo),
-) -> NoteResponse:
-    note: NoteResponse | None = repo.get_by_id(note_id)
+) -> Response:
+    note: NoteResponse | None = await repo.get_by_id(note_id)
 
     if not note:
         raise HTTPException(
@@ -64,7 +104,19 @@ def get_note(
             detail=f"Note with ID {note_id} not found",
         )
 
-    return note
+    etag = _make_etag(f"{note.id}-{_timestamp(note.updated_at)}".encode())
+    if _etag_matches(etag, if_none_match):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    # The repository already returns a validated NoteResponse, so dump it
+    # directly instead of having FastAPI validate it a second time
+    return Response(
+        content=note.model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @router.put(
@@ -73,7 +125,7 @@ def get_note(
     summary="Update a note",
     description="Update an existing note (full update - all fields required)",
 )
-def update_note(
+async def update_note(
     note_id: int,
     note_data: NoteFullUpdate,
     repo: NotesRepository = Depends(get_notes_repo),
@@ -91,7 +143,7 @@ def update_note(
     Raises:
         HTTPException: If note not found
     """
-    updated_note: NoteResponse | None = repo.update(note_id, note_data)
+    updated_note: NoteResponse | None = await repo.update(note_id, note_data)
 
     if not updated_note:
         raise HTTPException(
@@ -108,12 +160,12 @@ def update_note(
     summary="Partially update a note",
     description="Partially update an existing note (only provided fields will be updated)",
 )
-def patch_note(
+async def patch_note(
     note_id: int,
     note_data: NoteUpdate,
     repo: NotesRepository = Depends(get_notes_repo),
 ) -> NoteResponse:
-    updated_note: NoteResponse | None = repo.update(note_id, note_data)
+    updated_note: NoteResponse | None = await repo.update(note_id, note_data)
 
     if not updated_note:
         raise HTTPException(
@@ -130,11 +182,11 @@ def patch_note(
     summary="Delete a note",
     description="Delete a note by its ID",
 )
-def delete_note(
+async def delete_note(
     note_id: int,
     repo: NotesRepository = Depends(get_notes_repo),
 ) -> None:
-    deleted: bool = repo.delete(note_id)
+    deleted: bool = await repo.delete(note_id)
 
     if not deleted:
         raise HTTPException(
@@ -1,47 +1,99 @@
 """Database configuration and session management."""
 
 import logging
-from sqlalchemy import create_engine
+from collections.abc import AsyncGenerator
+from functools import lru_cache
+from typing import Annotated
+from fastapi import Depends
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, sessionmaker, declarative_base
-from app.config.env_settings import settings
-from app.core.constants import DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE_SECONDS
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import declarative_base
+from app.config.env_settings import get_settings
+from app.core.constants import (
+    DB_KEEPALIVES_COUNT,
+    DB_KEEPALIVES_IDLE_SECONDS,
+    DB_KEEPALIVES_INTERVAL_SECONDS,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_TIMEOUT_SECONDS,
+    DB_QUERY_CACHE_SIZE,
+)
 
 logger = logging.getLogger(__name__)
 
-DATABASE_URL: str = (
-    f"postgresql+psycopg2://{settings.DB_USER}:{settings.DB_PASSWORD}"
-    f"@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
-)
+Base = declarative_base()
 
-engine = create_engine(
-    DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_size=DB_POOL_SIZE,
-    max_overflow=DB_MAX_OVERFLOW,
-    pool_pre_ping=True,
-    pool_recycle=DB_POOL_RECYCLE_SECONDS,
-)
 
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-Base = declarative_base()
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Create the database engine on first use and reuse it afterwards.
+
+    Returns:
+        Async engine for the configured PostgreSQL database
 
+    Note:
+        Call get_engine.cache_clear() after get_settings.cache_clear() to
+        rebuild the engine from reloaded settings (dispose the old one first)
+    """
+    settings = get_settings()
+    database_url = (
+        f"postgresql+psycopg://{settings.DB_USER}:{settings.DB_PASSWORD}"
+        f"@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
+    )
+    return create_async_engine(
+        database_url,
+        echo=settings.DEBUG,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+        # Reuse the most recently returned connection so idle ones can time out
+        pool_use_lifo=True,
+        # Dead connections are detected by TCP keepalives in the background
+        # instead of a SELECT 1 round trip on every checkout; a connection that
+        # died since its last use fails one request rather than taxing every
+        # request.
+        pool_pre_ping=False,
+        pool_recycle=DB_POOL_RECYCLE_SECONDS,
+        connect_args={
+            "keepalives": 1,
+            "keepalives_idle": DB_KEEPALIVES_IDLE_SECONDS,
+            "keepalives_interval": DB_KEEPALIVES_INTERVAL_SECONDS,
+            "keepalives_count": DB_KEEPALIVES_COUNT,
+        },
+        query_cache_size=DB_QUERY_CACHE_SIZE,
+    )
+
+
+@lru_cache(maxsize=1)
+def _sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    # Keyed on the engine so a rebuilt engine gets a fresh session factory
+    return async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
-def get_db() -> Session:
-    """Dependency for getting database session.
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting an async database session.
 
     Yields:
-        Database session
+        Async database session
 
     Note:
         Automatically closes the session after use
     """
-    db: Session = SessionLocal()
-    try:
-        yield db
-    except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error: {e}")
-        raise
-    finally:
-        db.close()
+    async with _sessionmaker(get_engine())() as db:
+        try:
+            yield db
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error("Database error: %s", e)
+            raise
+
+
+# Request-scoped session dependency. FastAPI caches get_db per request, so every
+# repository built from DBSession within one request shares a single connection.
+DBSession = Annotated[AsyncSession, Depends(get_db, use_cache=True)]
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -24,6 +25,18 @@ class Settings(BaseSettings):
         description="Environment: development, staging, or production",
     )
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
+    INIT_SCHEMA: bool = Field(
+        default=False, description="Create missing database tables on startup"
+    )
+    HEALTH_CACHE_TTL: int = Field(
+        default=30, ge=0, description="Seconds to cache health check responses"
+    )
+
+    # Server settings
+    HOST: str = Field(default="0.0.0.0", description="Address the server binds to")
+    PORT: int = Field(default=8000, ge=1, le=65535, description="Server port")
+    # Each worker opens its own connection pool, so the default stays at one
+    WORKERS: int = Field(default=1, ge=1, description="Number of worker processes")
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -33,8 +46,18 @@ class Settings(BaseSettings):
     )
 
 
-try:
-    settings: Settings = Settings()
-except Exception as e:
-    logger.error(f"Error loading settings: {e}")
-    raise
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings on first use and reuse them afterwards.
+
+    Returns:
+        Application settings
+
+    Note:
+        Call get_settings.cache_clear() to reload (e.g. in tests)
+    """
+    try:
+        return Settings()
+    except Exception as e:
+        logger.error("Error loading settings: %s", e)
+        raise
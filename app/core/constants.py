@@ -7,7 +7,16 @@ DEFAULT_PAGE_SIZE = 100
 MAX_PAGE_SIZE = 100
 MIN_PAGE_SIZE = 1
 
+# Response compression
+GZIP_MINIMUM_SIZE = 1024  # Only compress responses larger than 1 KiB
+GZIP_COMPRESS_LEVEL = 5  # Balance between CPU cost and compression ratio
+
 # Database connection pool settings
-DB_POOL_SIZE = 10  # Number of connections to maintain in the pool
-DB_MAX_OVERFLOW = 20  # Maximum number of connections beyond pool_size
-DB_POOL_RECYCLE_SECONDS = 3600  # Recycle connections after 1 hour (in seconds)
+DB_POOL_SIZE = 20  # Number of connections to maintain in the pool
+DB_MAX_OVERFLOW = 10  # Maximum number of connections beyond pool_size
+DB_POOL_TIMEOUT_SECONDS = 5  # Fail fast when no pooled connection is free
+DB_POOL_RECYCLE_SECONDS = 1800  # Recycle connections after 30 minutes (in seconds)
+DB_KEEPALIVES_IDLE_SECONDS = 30  # Idle time before the first TCP keepalive probe
+DB_KEEPALIVES_INTERVAL_SECONDS = 10  # Time between unanswered keepalive probes
+DB_KEEPALIVES_COUNT = 3  # Unanswered probes before the connection is dropped
+DB_QUERY_CACHE_SIZE = 1200  # Compiled SQL statements kept in SQLAlchemy's cache
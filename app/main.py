@@ -1,11 +1,15 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.config.db_settings import engine, Base
-from app.config.env_settings import settings
+from app.config.db_settings import Base, get_engine
+from app.config.env_settings import get_settings
+from app.core.constants import GZIP_COMPRESS_LEVEL, GZIP_MINIMUM_SIZE
 from app.api import root, health
 from app.api.v1 import router as v1_router
 from app.api.exceptions import (
@@ -13,33 +17,36 @@ from app.api.exceptions import (
     general_exception_handler,
 )
 
-logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    logger.info(f"Starting application in {settings.ENVIRONMENT} environment...")
-    # In development mode, drop and recreate tables for a clean slate
-    if settings.ENVIRONMENT == "development":
+    # Settings are read here rather than at import so importing the app has no
+    # side effects and reloaded settings take effect on the next startup
+    logging.basicConfig(
+        level=getattr(logging, get_settings().LOG_LEVEL.upper(), logging.INFO),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    logger.info("Starting application in %s environment...", get_settings().ENVIRONMENT)
+    loop_cls = type(asyncio.get_running_loop())
+    logger.info("Event loop: %s.%s", loop_cls.__module__, loop_cls.__qualname__)
+    # Schema creation is opt-in; deployments are expected to manage the schema
+    if get_settings().INIT_SCHEMA:
         try:
-            Base.metadata.drop_all(bind=engine)
-            logger.info("Dropped existing tables (development mode)")
+            async with get_engine().begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            logger.info("Database tables created (INIT_SCHEMA enabled)")
         except Exception as e:
-            logger.warning(f"Could not drop tables: {e}")
-
-        try:
-            Base.metadata.create_all(bind=engine)
-            logger.info("Database tables created (development mode)")
-        except Exception as e:
-            logger.warning(f"Could not create tables: {e}")
-    else:
-        logger.info("Production mode")
+            logger.warning("Could not create tables: %s", e)
+    # FastAPI memoizes the schema on first build; build it now so the first
+    # /openapi.json or /docs request does not pay for route introspection
+    app.openapi()
     yield
     logger.info("Shutting down application...")
+    # Nothing to dispose if no request or startup step ever needed the engine
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
 
 
 app: FastAPI = FastAPI(
@@ -47,6 +54,7 @@ app: FastAPI = FastAPI(
     description="A simple note-taking API with PostgreSQL",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_tags=[
@@ -63,6 +71,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Added last so it wraps CORS and compresses the final response body
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=GZIP_MINIMUM_SIZE,
+    compresslevel=GZIP_COMPRESS_LEVEL,
+)
 
 # Register exception handlers
 app.add_exception_handler(SQLAlchemyError, sqlalchemy_exception_handler)
@@ -72,3 +86,17 @@ app.add_exception_handler(Exception, general_exception_handler)
 app.include_router(root.router)
 app.include_router(health.router)
 app.include_router(v1_router)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    settings = get_settings()
+    uvicorn.run(
+        "app.main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=settings.WORKERS,
+        loop="uvloop",
+        http="httptools",
+    )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Text, Integer, DateTime
+from sqlalchemy import Column, String, Text, Integer, DateTime, Index
 from sqlalchemy.sql import func
 from app.config.db_settings import Base
 
@@ -32,6 +32,10 @@ class Note(Base):
         nullable=False,
     )
 
+    # Serves the newest-first ORDER BY ... LIMIT used for pagination. create_all
+    # does not add it to an existing table; the README has the CREATE INDEX step.
+    __table_args__ = (Index("ix_notes_created_at_desc", created_at.desc()),)
+
     def __repr__(self) -> str:
         title_preview = self.title[:30] + "..." if len(self.title) > 30 else self.title
         return f"<Note(id={self.id}, title='{title_preview}')>"
@@ -1,19 +1,29 @@
 import logging
-from sqlalchemy import select
+import orjson
+from sqlalchemy import bindparam, delete, insert, lambda_stmt, select, update
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.constants import DEFAULT_PAGE_SIZE
 from app.repositories.models.note import Note
 from app.schemas.note import NoteCreate, NoteUpdate, NoteFullUpdate, NoteResponse
 
 logger = logging.getLogger(__name__)
 
+# Hot statements built once so every call reuses the same compiled SQL
+_SELECT_BY_ID = lambda_stmt(lambda: select(Note).where(Note.id == bindparam("id")))
+_SELECT_PAGE = lambda_stmt(
+    lambda: select(Note.id, Note.title, Note.content, Note.created_at, Note.updated_at)
+    .order_by(Note.created_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
 
 class NotesRepository:
-    def __init__(self, db: Session) -> None:
-        self.db: Session = db
+    def __init__(self, db: AsyncSession) -> None:
+        self.db: AsyncSession = db
 
-    def create(self, note_data: NoteCreate) -> NoteResponse:
+    async def create(self, note_data: NoteCreate) -> NoteResponse:
         """Create a new note in the database.
 
         Args:
@@ -26,43 +36,51 @@ class NotesRepository:
             SQLAlchemyError: If database operation fails
         """
         try:
-            note: Note = Note(title=note_data.title, content=note_data.content)
-            self.db.add(note)
-            self.db.commit()
-            self.db.refresh(note)
-            logger.info(f"Created note with ID: {note.id}")
+            # RETURNING hands back the server-generated id and timestamps,
+            # so no follow-up SELECT (refresh) is needed
+            stmt = (
+                insert(Note)
+                .values(title=note_data.title, content=note_data.content)
+                .returning(Note)
+            )
+            note: Note = (await self.db.execute(stmt)).scalar_one()
+            await self.db.commit()
+            logger.info("Created note with ID: %s", note.id)
             return NoteResponse.model_validate(note)
         except SQLAlchemyError as e:
-            self.db.rollback()
-            logger.error(f"Error creating note: {e}")
+            await self.db.rollback()
+            logger.error("Error creating note: %s", e)
             raise
 
-    def get_all(
+    async def get_all_json(
         self, skip: int = 0, limit: int = DEFAULT_PAGE_SIZE
-    ) -> list[NoteResponse]:
-        """Get all notes with pagination, ordered by creation date (newest first).
+    ) -> bytes:
+        """Get a page of notes already encoded as a JSON array.
+
+        Rows are encoded straight from the result mappings, so no ORM objects
+        or response models are built for the page.
 
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
 
         Returns:
-            List of note responses
+            JSON array of notes, ordered by creation date (newest first)
 
         Raises:
             SQLAlchemyError: If database operation fails
         """
         try:
-            stmt = (
-                select(Note).order_by(Note.created_at.desc()).offset(skip).limit(limit)
+            result = await self.db.execute(_SELECT_PAGE, {"skip": skip, "limit": limit})
+            # Rows were validated on write; OPT_UTC_Z matches pydantic's "Z" suffix
+            return orjson.dumps(
+                [dict(row) for row in result.mappings()], option=orjson.OPT_UTC_Z
             )
-            notes: list[Note] = list(self.db.scalars(stmt).all())
-            return [NoteResponse.model_validate(n) for n in notes]
         except SQLAlchemyError as e:
-            logger.error(f"Error fetching notes: {e}")
+            logger.error("Error fetching notes: %s", e)
             raise
 
-    def get_by_id(self, note_id: int) -> NoteResponse | None:
+    async def get_by_id(self, note_id: int) -> NoteResponse | None:
         """Get a note by its ID.
 
         Args:
@@ -75,14 +93,13 @@ class NotesRepository:
             SQLAlchemyError: If database operation fails
         """
         try:
-            stmt = select(Note).where(Note.id == note_id)
-            note: Note | None = self.db.scalar(stmt)
+            note: Note | None = await self.db.get(Note, note_id)
             return NoteResponse.model_validate(note) if note else None
         except SQLAlchemyError as e:
-            logger.error(f"Error fetching note {note_id}: {e}")
+            logger.error("Error fetching note %s: %s", note_id, e)
             raise
 
-    def update(
+    async def update(
         self, note_id: int, note_data: NoteFullUpdate | NoteUpdate
     ) -> NoteResponse | None:
         """Update an existing note.
@@ -98,26 +115,33 @@ class NotesRepository:
             SQLAlchemyError: If database operation fails
         """
         try:
-            stmt = select(Note).where(Note.id == note_id)
-            note: Note | None = self.db.scalar(stmt)
-            if not note:
-                return None
-
             exclude_unset = isinstance(note_data, NoteUpdate)
             update_data = note_data.model_dump(exclude_unset=exclude_unset)
-            for field, value in update_data.items():
-                setattr(note, field, value)
+            if not update_data:
+                # Nothing to change, so don't bump updated_at with an empty UPDATE
+                note: Note | None = await self.db.scalar(_SELECT_BY_ID, {"id": note_id})
+                return NoteResponse.model_validate(note) if note else None
 
-            self.db.commit()
-            self.db.refresh(note)
-            logger.info(f"Updated note with ID: {note_id}")
+            stmt = (
+                update(Note)
+                .where(Note.id == note_id)
+                .values(**update_data)
+                .returning(Note)
+            )
+            note = (await self.db.execute(stmt)).scalar_one_or_none()
+            if not note:
+                await self.db.rollback()
+                return None
+
+            await self.db.commit()
+            logger.info("Updated note with ID: %s", note_id)
             return NoteResponse.model_validate(note)
         except SQLAlchemyError as e:
-            self.db.rollback()
-            logger.error(f"Error updating note {note_id}: {e}")
+            await self.db.rollback()
+            logger.error("Error updating note %s: %s", note_id, e)
             raise
 
-    def delete(self, note_id: int) -> bool:
+    async def delete(self, note_id: int) -> bool:
         """Delete a note by its ID.
 
         Args:
@@ -130,15 +154,15 @@ class NotesRepository:
             SQLAlchemyError: If database operation fails
         """
         try:
-            stmt = select(Note).where(Note.id == note_id)
-            note: Note | None = self.db.scalar(stmt)
-            if not note:
+            stmt = delete(Note).where(Note.id == note_id).returning(Note.id)
+            deleted_id: int | None = (await self.db.execute(stmt)).scalar_one_or_none()
+            if deleted_id is None:
+                await self.db.rollback()
                 return False
-            self.db.delete(note)
-            self.db.commit()
-            logger.info(f"Deleted note with ID: {note_id}")
+            await self.db.commit()
+            logger.info("Deleted note with ID: %s", note_id)
             return True
         except SQLAlchemyError as e:
-            self.db.rollback()
-            logger.error(f"Error deleting note {note_id}: {e}")
+            await self.db.rollback()
+            logger.error("Error deleting note %s: %s", note_id, e)
             raise
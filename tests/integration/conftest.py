@@ -1,52 +1,116 @@
 import pytest
-from typing import Generator
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from functools import lru_cache
+from typing import AsyncGenerator, Generator
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.pool import StaticPool
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.config.db_settings import Base, get_db
-from app.main import app
+from app.main import app as _app
 from app.repositories.models.note import Note
 
 
-# Use SQLite in-memory database for integration testing
-TEST_DATABASE_URL = "sqlite:///:memory:"
+# Use SQLite in-memory database for integration testing. Each pytest-xdist
+# worker is its own process, so every worker gets a private database.
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-test_engine = create_engine(
-    TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
+@lru_cache
+def engine_for(url: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
 
-@pytest.fixture(scope="function")
-def db_session() -> Generator[Session, None, None]:
-    Base.metadata.create_all(bind=test_engine)
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work on sqlite
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
 
-    session = TestingSessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
-        Base.metadata.drop_all(bind=test_engine)
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+test_engine = engine_for(TEST_DATABASE_URL)
+
+
+@pytest.fixture(scope="session")
+async def db_schema() -> AsyncGenerator[None, None]:
+    # Runs on the session-wide event loop shared by every async test
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    # Close the aiosqlite worker thread so it does not outlive the test run
+    await test_engine.dispose()
 
 
 @pytest.fixture(scope="function")
-def client(db_session: Session) -> Generator[TestClient, None, None]:
-    def override_get_db():
+async def db_session(db_schema: None) -> AsyncGenerator[AsyncSession, None]:
+    """Session bound to an outer transaction that is rolled back after each test.
+
+    Commits made by the code under test only release a SAVEPOINT, so every
+    test starts from an empty schema without recreating tables.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            autoflush=False,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
         try:
-            yield db_session
+            yield session
         finally:
-            pass
+            await session.close()
+            await trans.rollback()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def app_instance() -> FastAPI:
+    """The application under test, with its OpenAPI schema built once per worker."""
+    _app.openapi()
+    return _app
 
-    app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as test_client:
+@pytest.fixture(scope="session")
+def app_client(
+    app_instance: FastAPI, db_schema: None
+) -> Generator[TestClient, None, None]:
+    """TestClient shared by the whole run so the app lifespan starts only once."""
+    with TestClient(app_instance) as test_client:
         yield test_client
 
-    app.dependency_overrides.clear()
+
+@pytest.fixture(scope="function")
+def client(
+    app_instance: FastAPI, app_client: TestClient, db_session: AsyncSession
+) -> Generator[TestClient, None, None]:
+    """The shared app_client, routed to this test's db_session.
+
+    Tests must pass headers per request rather than setting client.headers,
+    since the same client instance serves the whole run.
+    """
+
+    async def override_get_db():
+        try:
+            yield db_session
+        finally:
+            pass
+
+    app_instance.dependency_overrides[get_db] = override_get_db
+    try:
+        yield app_client
+    finally:
+        app_instance.dependency_overrides.pop(get_db, None)
 
 
 @pytest.fixture
@@ -58,23 +122,26 @@ def sample_note_data() -> dict[str, str]:
 
 
 @pytest.fixture
-def sample_note(db_session: Session, sample_note_data: dict[str, str]) -> Note:
+async def sample_note(
+    db_session: AsyncSession, sample_note_data: dict[str, str]
+) -> Note:
     note = Note(
         title=sample_note_data["title"],
         content=sample_note_data["content"],
     )
     db_session.add(note)
-    db_session.commit()
-    db_session.refresh(note)
+    await db_session.commit()
+    await db_session.refresh(note)
     return note
 
 
 @pytest.fixture
-def multiple_notes(db_session: Session) -> list[Note]:
-    notes = [Note(title=f"Note {i}", content=f"Content {i}") for i in range(1, 6)]
-    for note in notes:
-        db_session.add(note)
-    db_session.commit()
-    for note in notes:
-        db_session.refresh(note)
+async def multiple_notes(db_session: AsyncSession) -> list[Note]:
+    # One multi-row INSERT ... RETURNING instead of a flush and refresh per note
+    result = await db_session.scalars(
+        insert(Note).returning(Note, sort_by_parameter_order=True),
+        [{"title": f"Note {i}", "content": f"Content {i}"} for i in range(1, 6)],
+    )
+    notes = list(result)
+    await db_session.commit()
     return notes
@@ -1,6 +1,21 @@
+from unittest.mock import Mock, patch
+
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import health
+from app.config.env_settings import get_settings
+
+
+@pytest.fixture(autouse=True)
+def clear_health_cache():
+    """Start every test with a cold health cache."""
+    health._cache.clear()
+    yield
+    health._cache.clear()
 
 
 @pytest.mark.integration
@@ -27,3 +42,57 @@ class TestHealthCheck:
             "database" in data["message"].lower()
             or "running" in data["message"].lower()
         )
+
+    def test_detailed_health_check_cached(self, client: TestClient):
+        first = client.get("/health/detailed")
+        second = client.get("/health/detailed")
+
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.json() == first.json()
+        assert second.headers["cache-control"].startswith("max-age=")
+
+    def test_detailed_health_check_failure_not_cached(
+        self, client: TestClient, db_session: AsyncSession
+    ):
+        error = OperationalError("SELECT 1", {}, Exception("connection refused"))
+        with patch.object(db_session, "execute", side_effect=error):
+            failed = client.get("/health/detailed")
+
+        recovered = client.get("/health/detailed")
+
+        assert failed.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert recovered.status_code == status.HTTP_200_OK
+        assert recovered.headers["x-cache"] == "MISS"
+
+    def test_health_check_cache_expires(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        ttl = get_settings().HEALTH_CACHE_TTL
+        clock = Mock(return_value=1000.0)
+        monkeypatch.setattr(health, "time", Mock(monotonic=clock))
+
+        first = client.get("/health")
+        clock.return_value += ttl - 1
+        second = client.get("/health")
+        clock.return_value += 1
+        third = client.get("/health")
+
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert third.headers["x-cache"] == "MISS"
+        assert third.headers["cache-control"] == f"max-age={ttl}"
+
+    def test_health_check_hit_sends_remaining_lifetime(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        ttl = get_settings().HEALTH_CACHE_TTL
+        clock = Mock(return_value=1000.0)
+        monkeypatch.setattr(health, "time", Mock(monotonic=clock))
+
+        client.get("/health")
+        clock.return_value += ttl - 1
+        response = client.get("/health")
+
+        assert response.headers["x-cache"] == "HIT"
+        assert response.headers["cache-control"] == "max-age=1"
@@ -4,13 +4,15 @@ from fastapi.testclient import TestClient
 
 from app.core.constants import API_VERSION_PREFIX
 
+NOTES_URL = f"{API_VERSION_PREFIX}/notes/"
+
 
 @pytest.mark.integration
 class TestCreateNote:
     def test_create_note_success(
         self, client: TestClient, sample_note_data: dict[str, str]
     ):
-        response = client.post(f"{API_VERSION_PREFIX}/notes/", json=sample_note_data)
+        response = client.post(NOTES_URL, json=sample_note_data)
 
         assert response.status_code == status.HTTP_201_CREATED
         data = response.json()
@@ -21,61 +23,24 @@ class TestCreateNote:
         assert "updated_at" in data
 
     def test_create_note_minimal(self, client: TestClient):
-        response = client.post(
-            f"{API_VERSION_PREFIX}/notes/", json={"title": "Minimal Note"}
-        )
+        response = client.post(NOTES_URL, json={"title": "Minimal Note"})
 
         assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
-        assert data["title"] == "Minimal Note"
-        assert data["content"] == ""
-
-    def test_create_note_missing_title(self, client: TestClient):
-        response = client.post(
-            f"{API_VERSION_PREFIX}/notes/", json={"content": "Some content"}
-        )
-
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
-        data = response.json()
-        assert "detail" in data
-        assert isinstance(data["detail"], list)
-        assert len(data["detail"]) > 0
-        error_locs = [err.get("loc", []) for err in data["detail"]]
-        assert any("title" in str(loc).lower() for loc in error_locs)
-
-    def test_create_note_empty_title(self, client: TestClient):
-        response = client.post(f"{API_VERSION_PREFIX}/notes/", json={"title": ""})
-
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
-
-    def test_create_note_title_too_long(self, client: TestClient):
-        long_title = "a" * 256
-        response = client.post(
-            f"{API_VERSION_PREFIX}/notes/", json={"title": long_title}
-        )
-
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
-
-    def test_create_note_content_too_long(self, client: TestClient):
-        long_content = "a" * 10001
-        response = client.post(
-            f"{API_VERSION_PREFIX}/notes/",
-            json={"title": "Test", "content": long_content},
-        )
-
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        # Compact orjson output, so the fields can be checked without decoding
+        assert b'"title":"Minimal Note"' in response.content
+        assert b'"content":""' in response.content
 
 
 @pytest.mark.integration
 class TestListNotes:
     def test_list_notes_empty(self, client: TestClient):
-        response = client.get(f"{API_VERSION_PREFIX}/notes/")
+        response = client.get(NOTES_URL)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == []
 
     def test_list_notes_single(self, client: TestClient, sample_note):
-        response = client.get(f"{API_VERSION_PREFIX}/notes/")
+        response = client.get(NOTES_URL)
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -84,7 +49,7 @@ class TestListNotes:
         assert data[0]["title"] == sample_note.title
 
     def test_list_notes_multiple(self, client: TestClient, multiple_notes):
-        response = client.get(f"{API_VERSION_PREFIX}/notes/")
+        response = client.get(NOTES_URL)
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -93,46 +58,90 @@ class TestListNotes:
         assert all("title" in note for note in data)
 
     def test_list_notes_pagination_skip(self, client: TestClient, multiple_notes):
-        response = client.get(f"{API_VERSION_PREFIX}/notes/?skip=2")
+        response = client.get(f"{NOTES_URL}?skip=2")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert len(data) == 3
 
     def test_list_notes_pagination_limit(self, client: TestClient, multiple_notes):
-        response = client.get(f"{API_VERSION_PREFIX}/notes/?limit=2")
+        response = client.get(f"{NOTES_URL}?limit=2")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert len(data) == 2
 
     def test_list_notes_pagination_both(self, client: TestClient, multiple_notes):
-        response = client.get(f"{API_VERSION_PREFIX}/notes/?skip=1&limit=2")
+        response = client.get(f"{NOTES_URL}?skip=1&limit=2")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert len(data) == 2
 
-    def test_list_notes_invalid_skip(self, client: TestClient):
-        response = client.get(f"{API_VERSION_PREFIX}/notes/?skip=-1")
+    def test_list_notes_gzip_large_response(self, client: TestClient):
+        for i in range(3):
+            client.post(
+                NOTES_URL,
+                json={"title": f"Note {i}", "content": "a" * 1000},
+            )
 
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        response = client.get(NOTES_URL, headers={"Accept-Encoding": "gzip"})
 
-    def test_list_notes_invalid_limit_zero(self, client: TestClient):
-        response = client.get(f"{API_VERSION_PREFIX}/notes/?limit=0")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()) == 3
 
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    def test_list_notes_small_response_not_compressed(self, client: TestClient):
+        response = client.get(NOTES_URL, headers={"Accept-Encoding": "gzip"})
 
-    def test_list_notes_invalid_limit_too_high(self, client: TestClient):
-        response = client.get(f"{API_VERSION_PREFIX}/notes/?limit=101")
+        assert response.status_code == status.HTTP_200_OK
+        assert "content-encoding" not in response.headers
 
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    def test_list_notes_etag_not_modified(self, client: TestClient, multiple_notes):
+        response = client.get(NOTES_URL)
+        etag = response.headers["etag"]
+
+        cached = client.get(NOTES_URL, headers={"If-None-Match": etag})
+
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+    def test_list_notes_etag_is_weak(self, client: TestClient, multiple_notes):
+        plain = client.get(NOTES_URL, headers={"Accept-Encoding": "identity"})
+        gzipped = client.get(NOTES_URL, headers={"Accept-Encoding": "gzip"})
+
+        assert plain.headers["etag"].startswith('W/"')
+        assert gzipped.headers["etag"] == plain.headers["etag"]
+
+    def test_list_notes_etag_changes_after_update(
+        self, client: TestClient, multiple_notes
+    ):
+        etag = client.get(NOTES_URL).headers["etag"]
+        client.patch(f"{NOTES_URL}{multiple_notes[0].id}", json={"title": "Changed"})
+
+        response = client.get(NOTES_URL, headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+
+    def test_list_notes_etag_changes_after_delete(
+        self, client: TestClient, multiple_notes
+    ):
+        etag = client.get(NOTES_URL).headers["etag"]
+        client.delete(f"{NOTES_URL}{multiple_notes[0].id}")
+
+        response = client.get(NOTES_URL, headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 4
+        assert response.headers["etag"] != etag
 
 
 @pytest.mark.integration
 class TestGetNote:
     def test_get_note_success(self, client: TestClient, sample_note):
-        response = client.get(f"{API_VERSION_PREFIX}/notes/{sample_note.id}")
+        response = client.get(f"{NOTES_URL}{sample_note.id}")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -140,25 +149,84 @@ class TestGetNote:
         assert data["title"] == sample_note.title
         assert data["content"] == sample_note.content
 
+    def test_get_note_etag_not_modified(self, client: TestClient, sample_note):
+        response = client.get(f"{NOTES_URL}{sample_note.id}")
+        etag = response.headers["etag"]
+
+        cached = client.get(
+            f"{NOTES_URL}{sample_note.id}",
+            headers={"If-None-Match": etag},
+        )
+
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+        assert cached.content == b""
+
+    def test_get_note_etag_mismatch(self, client: TestClient, sample_note):
+        response = client.get(
+            f"{NOTES_URL}{sample_note.id}",
+            headers={"If-None-Match": '"stale"'},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["id"] == sample_note.id
+
     def test_get_note_not_found(self, client: TestClient):
-        response = client.get(f"{API_VERSION_PREFIX}/notes/999")
+        response = client.get(f"{NOTES_URL}999")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert "not found" in response.json()["detail"].lower()
 
-    def test_get_note_invalid_id(self, client: TestClient):
-        response = client.get(f"{API_VERSION_PREFIX}/notes/invalid")
+
+@pytest.mark.integration
+class TestValidationErrors:
+    @pytest.mark.parametrize(
+        "method, path, payload, loc",
+        [
+            ("post", "", {"content": "Some content"}, ["body", "title"]),
+            ("post", "", {"title": ""}, ["body", "title"]),
+            ("post", "", {"title": "a" * 256}, ["body", "title"]),
+            (
+                "post",
+                "",
+                {"title": "Test", "content": "a" * 10001},
+                ["body", "content"],
+            ),
+            ("get", "?skip=-1", None, ["query", "skip"]),
+            ("get", "?limit=0", None, ["query", "limit"]),
+            ("get", "?limit=101", None, ["query", "limit"]),
+            ("get", "invalid", None, ["path", "note_id"]),
+        ],
+        ids=[
+            "missing_title",
+            "empty_title",
+            "title_too_long",
+            "content_too_long",
+            "negative_skip",
+            "zero_limit",
+            "limit_too_high",
+            "non_integer_id",
+        ],
+    )
+    def test_invalid_request_returns_422(
+        self,
+        client: TestClient,
+        method: str,
+        path: str,
+        payload: dict[str, str] | None,
+        loc: list[str],
+    ):
+        kwargs = {"json": payload} if payload is not None else {}
+        response = getattr(client, method)(f"{NOTES_URL}{path}", **kwargs)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        assert loc in [err["loc"] for err in response.json()["detail"]]
 
 
 @pytest.mark.integration
 class TestUpdateNote:
     def test_update_note_success(self, client: TestClient, sample_note):
         update_data = {"title": "Updated Title", "content": "Updated Content"}
-        response = client.put(
-            f"{API_VERSION_PREFIX}/notes/{sample_note.id}", json=update_data
-        )
+        response = client.put(f"{NOTES_URL}{sample_note.id}", json=update_data)
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -170,17 +238,13 @@ class TestUpdateNote:
         """Test that PUT requires title field (content has default)."""
         # Missing title should fail validation
         update_data = {"content": "Only content"}
-        response = client.put(
-            f"{API_VERSION_PREFIX}/notes/{sample_note.id}", json=update_data
-        )
+        response = client.put(f"{NOTES_URL}{sample_note.id}", json=update_data)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
 
     def test_update_note_requires_all_fields(self, client: TestClient, sample_note):
         update_data = {"title": "Updated Title Only"}
-        response = client.put(
-            f"{API_VERSION_PREFIX}/notes/{sample_note.id}", json=update_data
-        )
+        response = client.put(f"{NOTES_URL}{sample_note.id}", json=update_data)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
         data = response.json()
@@ -192,15 +256,13 @@ class TestUpdateNote:
 
     def test_update_note_not_found(self, client: TestClient):
         update_data = {"title": "New Title", "content": "New Content"}
-        response = client.put(f"{API_VERSION_PREFIX}/notes/999", json=update_data)
+        response = client.put(f"{NOTES_URL}999", json=update_data)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     def test_update_note_invalid_title(self, client: TestClient, sample_note):
         update_data = {"title": "", "content": "Some content"}
-        response = client.put(
-            f"{API_VERSION_PREFIX}/notes/{sample_note.id}", json=update_data
-        )
+        response = client.put(f"{NOTES_URL}{sample_note.id}", json=update_data)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
 
@@ -209,9 +271,7 @@ class TestUpdateNote:
 class TestPatchNote:
     def test_patch_note_title_only(self, client: TestClient, sample_note):
         patch_data = {"title": "Patched Title"}
-        response = client.patch(
-            f"{API_VERSION_PREFIX}/notes/{sample_note.id}", json=patch_data
-        )
+        response = client.patch(f"{NOTES_URL}{sample_note.id}", json=patch_data)
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -220,9 +280,7 @@ class TestPatchNote:
 
     def test_patch_note_content_only(self, client: TestClient, sample_note):
         patch_data = {"content": "Patched Content"}
-        response = client.patch(
-            f"{API_VERSION_PREFIX}/notes/{sample_note.id}", json=patch_data
-        )
+        response = client.patch(f"{NOTES_URL}{sample_note.id}", json=patch_data)
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -231,17 +289,14 @@ class TestPatchNote:
 
     def test_patch_note_both_fields(self, client: TestClient, sample_note):
         patch_data = {"title": "New Title", "content": "New Content"}
-        response = client.patch(
-            f"{API_VERSION_PREFIX}/notes/{sample_note.id}", json=patch_data
-        )
+        response = client.patch(f"{NOTES_URL}{sample_note.id}", json=patch_data)
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["title"] == patch_data["title"]
-        assert data["content"] == patch_data["content"]
+        assert b'"title":"New Title"' in response.content
+        assert b'"content":"New Content"' in response.content
 
     def test_patch_note_empty(self, client: TestClient, sample_note):
-        response = client.patch(f"{API_VERSION_PREFIX}/notes/{sample_note.id}", json={})
+        response = client.patch(f"{NOTES_URL}{sample_note.id}", json={})
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -250,7 +305,7 @@ class TestPatchNote:
 
     def test_patch_note_not_found(self, client: TestClient):
         patch_data = {"title": "New Title"}
-        response = client.patch(f"{API_VERSION_PREFIX}/notes/999", json=patch_data)
+        response = client.patch(f"{NOTES_URL}999", json=patch_data)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
@@ -258,22 +313,22 @@ class TestPatchNote:
 @pytest.mark.integration
 class TestDeleteNote:
     def test_delete_note_success(self, client: TestClient, sample_note):
-        response = client.delete(f"{API_VERSION_PREFIX}/notes/{sample_note.id}")
+        response = client.delete(f"{NOTES_URL}{sample_note.id}")
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert response.content == b""
 
-        get_response = client.get(f"{API_VERSION_PREFIX}/notes/{sample_note.id}")
+        get_response = client.get(f"{NOTES_URL}{sample_note.id}")
         assert get_response.status_code == status.HTTP_404_NOT_FOUND
 
     def test_delete_note_not_found(self, client: TestClient):
-        response = client.delete(f"{API_VERSION_PREFIX}/notes/999")
+        response = client.delete(f"{NOTES_URL}999")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     def test_delete_note_twice(self, client: TestClient, sample_note):
-        response1 = client.delete(f"{API_VERSION_PREFIX}/notes/{sample_note.id}")
+        response1 = client.delete(f"{NOTES_URL}{sample_note.id}")
         assert response1.status_code == status.HTTP_204_NO_CONTENT
 
-        response2 = client.delete(f"{API_VERSION_PREFIX}/notes/{sample_note.id}")
+        response2 = client.delete(f"{NOTES_URL}{sample_note.id}")
         assert response2.status_code == status.HTTP_404_NOT_FOUND
@@ -1,5 +1,5 @@
 import pytest
-from fastapi import status
+from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
 
@@ -15,3 +15,37 @@ class TestRootEndpoint:
         assert "description" in data
         assert data["docs_url"] == "/docs"
         assert data["health_url"] == "/health"
+
+
+@pytest.mark.integration
+class TestOpenAPISchema:
+    def test_schema_built_at_startup(self, app_instance: FastAPI, client: TestClient):
+        assert app_instance.openapi_schema is not None
+
+        response = client.get("/openapi.json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == app_instance.openapi_schema
+
+    def test_notes_operations_tagged_once(self, app_instance: FastAPI):
+        paths = app_instance.openapi_schema["paths"]
+
+        tags = [op["tags"] for op in paths["/v1/notes/"].values()]
+
+        assert tags == [["notes"], ["notes"]]
+
+    def test_schema_is_memoized(self, app_instance: FastAPI):
+        assert app_instance.openapi() is app_instance.openapi_schema
+
+    def test_read_endpoints_document_response_schema(self, app_instance: FastAPI):
+        paths = app_instance.openapi_schema["paths"]
+
+        get_note = paths["/v1/notes/{note_id}"]["get"]["responses"]["200"]
+        list_notes = paths["/v1/notes/"]["get"]["responses"]["200"]
+
+        assert get_note["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/NoteResponse"
+        }
+        assert list_notes["content"]["application/json"]["schema"]["items"] == {
+            "$ref": "#/components/schemas/NoteResponse"
+        }
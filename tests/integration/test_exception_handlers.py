@@ -1,192 +1,125 @@
 import pytest
+from typing import Generator
 from unittest.mock import patch
-from fastapi import status
+from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError, OperationalError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.constants import API_VERSION_PREFIX
-from app.main import app
 from app.config.db_settings import get_db
+from app.repositories.notes_repository import NotesRepository
+
+NOTES_URL = f"{API_VERSION_PREFIX}/notes/"
+
+
+@pytest.fixture(scope="session")
+def _exception_client(app_instance: FastAPI) -> Generator[TestClient, None, None]:
+    # raise_server_exceptions=False allows exception handlers to return responses.
+    # One client serves the whole run, so its event loop and lifespan start once.
+    with TestClient(app_instance, raise_server_exceptions=False) as test_client:
+        yield test_client
 
 
 @pytest.fixture
-def exception_client(db_session: Session) -> TestClient:
+def exception_client(
+    app_instance: FastAPI, _exception_client: TestClient, db_session: AsyncSession
+) -> Generator[TestClient, None, None]:
     """Test client configured to not raise exceptions (for testing exception handlers)."""
 
-    def override_get_db():
+    async def override_get_db():
         try:
             yield db_session
         finally:
             pass
 
-    app.dependency_overrides[get_db] = override_get_db
+    app_instance.dependency_overrides[get_db] = override_get_db
+    try:
+        yield _exception_client
+    finally:
+        app_instance.dependency_overrides.pop(get_db, None)
 
-    # raise_server_exceptions=False allows exception handlers to return responses
-    test_client = TestClient(app, raise_server_exceptions=False)
-    yield test_client
 
-    app.dependency_overrides.clear()
+_DATABASE_ERROR_DETAIL = "A database error occurred. Please try again later."
+_INTERNAL_ERROR_DETAIL = "An unexpected error occurred. Please try again later."
+
+_NOTE_BODY = {"title": "Test", "content": "Content"}
 
 
 @pytest.mark.integration
 class TestSQLAlchemyExceptionHandler:
-    def test_sqlalchemy_error_returns_500(self, exception_client: TestClient):
-        with patch(
-            "app.repositories.notes_repository.NotesRepository.create"
-        ) as mock_create:
-            mock_create.side_effect = SQLAlchemyError("Database connection failed")
-
-            response = exception_client.post(
-                f"{API_VERSION_PREFIX}/notes/",
-                json={"title": "Test", "content": "Content"},
-            )
-
-            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-            data = response.json()
-            assert (
-                data["detail"] == "A database error occurred. Please try again later."
-            )
-            assert data["type"] == "database_error"
-
-    def test_integrity_error_returns_500(self, exception_client: TestClient):
-        with patch(
-            "app.repositories.notes_repository.NotesRepository.create"
-        ) as mock_create:
-            mock_create.side_effect = IntegrityError("statement", "params", "orig")
-
-            response = exception_client.post(
-                f"{API_VERSION_PREFIX}/notes/",
-                json={"title": "Test", "content": "Content"},
-            )
-
-            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-            data = response.json()
-            assert data["type"] == "database_error"
-
-    def test_operational_error_returns_500(self, exception_client: TestClient):
-        with patch(
-            "app.repositories.notes_repository.NotesRepository.get_all"
-        ) as mock_get:
-            mock_get.side_effect = OperationalError("statement", "params", "orig")
-
-            response = exception_client.get(f"{API_VERSION_PREFIX}/notes/")
-
-            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-            data = response.json()
-            assert data["type"] == "database_error"
-
-    def test_sqlalchemy_error_on_get_by_id(self, exception_client: TestClient):
-        with patch(
-            "app.repositories.notes_repository.NotesRepository.get_by_id"
-        ) as mock_get:
-            mock_get.side_effect = SQLAlchemyError("Query failed")
-
-            response = exception_client.get(f"{API_VERSION_PREFIX}/notes/1")
-
-            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-            data = response.json()
-            assert data["type"] == "database_error"
-
-    def test_sqlalchemy_error_on_update(
-        self, exception_client: TestClient, sample_note
+    @pytest.mark.parametrize(
+        "method, http_method, path, body, error",
+        [
+            ("create", "post", "", _NOTE_BODY, SQLAlchemyError("Connection failed")),
+            ("create", "post", "", _NOTE_BODY, IntegrityError("stmt", "p", "orig")),
+            ("get_all_json", "get", "", None, OperationalError("stmt", "p", "orig")),
+            ("get_by_id", "get", "1", None, SQLAlchemyError("Query failed")),
+            ("update", "put", "1", _NOTE_BODY, SQLAlchemyError("Update failed")),
+            ("delete", "delete", "1", None, SQLAlchemyError("Delete failed")),
+        ],
+        ids=["create", "integrity", "operational", "get_by_id", "update", "delete"],
+    )
+    def test_database_errors_return_500(
+        self,
+        exception_client: TestClient,
+        method: str,
+        http_method: str,
+        path: str,
+        body: dict[str, str] | None,
+        error: SQLAlchemyError,
     ):
-        with patch(
-            "app.repositories.notes_repository.NotesRepository.update"
-        ) as mock_update:
-            mock_update.side_effect = SQLAlchemyError("Update failed")
-
-            response = exception_client.put(
-                f"{API_VERSION_PREFIX}/notes/{sample_note.id}",
-                json={"title": "Updated", "content": "Updated content"},
+        with patch.object(NotesRepository, method, side_effect=error):
+            kwargs = {"json": body} if body is not None else {}
+            response = getattr(exception_client, http_method)(
+                f"{NOTES_URL}{path}", **kwargs
             )
 
-            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-            data = response.json()
-            assert data["type"] == "database_error"
-
-    def test_sqlalchemy_error_on_delete(
-        self, exception_client: TestClient, sample_note
-    ):
-        with patch(
-            "app.repositories.notes_repository.NotesRepository.delete"
-        ) as mock_delete:
-            mock_delete.side_effect = SQLAlchemyError("Delete failed")
-
-            response = exception_client.delete(
-                f"{API_VERSION_PREFIX}/notes/{sample_note.id}"
-            )
-
-            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-            data = response.json()
-            assert data["type"] == "database_error"
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.json() == {
+            "detail": _DATABASE_ERROR_DETAIL,
+            "type": "database_error",
+        }
 
 
 @pytest.mark.integration
 class TestGeneralExceptionHandler:
-    def test_unexpected_exception_returns_500(self, exception_client: TestClient):
-        with patch(
-            "app.repositories.notes_repository.NotesRepository.create"
-        ) as mock_create:
-            mock_create.side_effect = ValueError("Unexpected error")
-
-            response = exception_client.post(
-                f"{API_VERSION_PREFIX}/notes/",
-                json={"title": "Test", "content": "Content"},
-            )
-
-            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-            data = response.json()
-            assert (
-                data["detail"]
-                == "An unexpected error occurred. Please try again later."
-            )
-            assert data["type"] == "internal_server_error"
-
-    def test_key_error_returns_500(self, exception_client: TestClient):
-        with patch(
-            "app.repositories.notes_repository.NotesRepository.get_all"
-        ) as mock_get:
-            mock_get.side_effect = KeyError("missing_key")
-
-            response = exception_client.get(f"{API_VERSION_PREFIX}/notes/")
-
-            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-            data = response.json()
-            assert data["type"] == "internal_server_error"
-
-    def test_type_error_returns_500(self, exception_client: TestClient):
-        with patch(
-            "app.repositories.notes_repository.NotesRepository.get_by_id"
-        ) as mock_get:
-            mock_get.side_effect = TypeError("Type mismatch")
-
-            response = exception_client.get(f"{API_VERSION_PREFIX}/notes/1")
-
-            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-            data = response.json()
-            assert data["type"] == "internal_server_error"
-
-    def test_runtime_error_returns_500(self, exception_client: TestClient, sample_note):
-        with patch(
-            "app.repositories.notes_repository.NotesRepository.update"
-        ) as mock_update:
-            mock_update.side_effect = RuntimeError("Runtime issue")
-
-            response = exception_client.patch(
-                f"{API_VERSION_PREFIX}/notes/{sample_note.id}",
-                json={"title": "Updated"},
+    @pytest.mark.parametrize(
+        "method, http_method, path, body, error",
+        [
+            ("create", "post", "", _NOTE_BODY, ValueError("Unexpected error")),
+            ("get_all_json", "get", "", None, KeyError("missing_key")),
+            ("get_by_id", "get", "1", None, TypeError("Type mismatch")),
+            ("update", "patch", "1", {"title": "Updated"}, RuntimeError("Runtime")),
+        ],
+        ids=["value_error", "key_error", "type_error", "runtime_error"],
+    )
+    def test_unexpected_errors_return_500(
+        self,
+        exception_client: TestClient,
+        method: str,
+        http_method: str,
+        path: str,
+        body: dict[str, str] | None,
+        error: Exception,
+    ):
+        with patch.object(NotesRepository, method, side_effect=error):
+            kwargs = {"json": body} if body is not None else {}
+            response = getattr(exception_client, http_method)(
+                f"{NOTES_URL}{path}", **kwargs
             )
 
-            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-            data = response.json()
-            assert data["type"] == "internal_server_error"
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.json() == {
+            "detail": _INTERNAL_ERROR_DETAIL,
+            "type": "internal_server_error",
+        }
 
 
 @pytest.mark.integration
 class TestHTTPExceptionNotCaught:
     def test_404_not_found_not_caught_by_handlers(self, client: TestClient):
-        response = client.get(f"{API_VERSION_PREFIX}/notes/999")
+        response = client.get(f"{NOTES_URL}999")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
         data = response.json()
@@ -194,7 +127,7 @@ class TestHTTPExceptionNotCaught:
         assert "type" not in data
 
     def test_404_on_delete_not_caught_by_handlers(self, client: TestClient):
-        response = client.delete(f"{API_VERSION_PREFIX}/notes/999")
+        response = client.delete(f"{NOTES_URL}999")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
         data = response.json()
@@ -207,13 +140,11 @@ class TestExceptionHandlerOrder:
     def test_sqlalchemy_error_takes_precedence_over_general(
         self, exception_client: TestClient
     ):
-        with patch(
-            "app.repositories.notes_repository.NotesRepository.create"
-        ) as mock_create:
+        with patch.object(NotesRepository, "create") as mock_create:
             mock_create.side_effect = SQLAlchemyError("DB error")
 
             response = exception_client.post(
-                f"{API_VERSION_PREFIX}/notes/",
+                NOTES_URL,
                 json={"title": "Test", "content": "Content"},
             )
 
@@ -0,0 +1,94 @@
+import json
+from datetime import datetime
+from typing import AsyncGenerator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.config.db_settings import Base, get_engine
+from app.repositories.notes_repository import NotesRepository
+from app.schemas.note import NoteCreate, NoteFullUpdate, NoteUpdate
+
+
+@pytest.fixture(scope="module")
+async def pg_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """The application's own engine, pointed at the server from DB_* settings."""
+    engine = get_engine()
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except OperationalError as e:
+        await engine.dispose()
+        pytest.skip(f"PostgreSQL is not reachable: {e.orig}")
+
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def pg_session(pg_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """Session inside an outer transaction that is rolled back after each test.
+
+    DDL is transactional on PostgreSQL, so creating the schema inside that
+    transaction leaves an existing database exactly as it was found.
+    """
+    async with pg_engine.connect() as conn:
+        trans = await conn.begin()
+        await conn.run_sync(Base.metadata.create_all)
+        session = AsyncSession(
+            bind=conn,
+            autoflush=False,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+@pytest.mark.integration
+@pytest.mark.postgres
+class TestPostgresSmoke:
+    async def test_crud_round_trip(self, pg_session: AsyncSession):
+        repo = NotesRepository(pg_session)
+
+        created = await repo.create(NoteCreate(title="Smoke", content="Body"))
+        fetched = await repo.get_by_id(created.id)
+        replaced = await repo.update(
+            created.id, NoteFullUpdate(title="Replaced", content="New body")
+        )
+        patched = await repo.update(created.id, NoteUpdate(content="Patched"))
+        deleted = await repo.delete(created.id)
+
+        assert fetched == created
+        assert replaced is not None
+        assert replaced.title == "Replaced"
+        assert patched is not None
+        assert patched.title == "Replaced"
+        assert patched.content == "Patched"
+        assert deleted is True
+        assert await repo.get_by_id(created.id) is None
+
+    async def test_get_all_json(self, pg_session: AsyncSession):
+        repo = NotesRepository(pg_session)
+        created = [
+            await repo.create(NoteCreate(title=f"Note {i}", content=f"Content {i}"))
+            for i in range(3)
+        ]
+
+        page = await repo.get_all_json(skip=1, limit=2)
+
+        data = json.loads(page)
+        assert len(data) == 2
+        assert {"id", "title", "content", "created_at", "updated_at"} == set(data[0])
+        # timestamptz values come back in the session TimeZone, so compare the
+        # parsed instant rather than the offset suffix
+        by_id = {note.id: note for note in created}
+        for item in data:
+            created_at = datetime.fromisoformat(item["created_at"])
+            assert created_at.tzinfo is not None
+            assert created_at == by_id[item["id"]].created_at
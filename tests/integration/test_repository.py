@@ -1,214 +1,218 @@
+import json
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.notes_repository import NotesRepository
 from app.schemas.note import NoteCreate, NoteUpdate, NoteResponse
 from app.repositories.models.note import Note
 
 
+async def _seed_notes(db_session: AsyncSession, count: int) -> None:
+    """Insert count notes in a single executemany round trip."""
+    await db_session.execute(
+        insert(Note),
+        [{"title": f"Note {i}", "content": f"Content {i}"} for i in range(count)],
+    )
+    await db_session.commit()
+
+
 @pytest.mark.integration
 class TestNotesRepositoryCreate:
-    def test_create_note_success(self, db_session: Session):
+    async def test_create_note_success(self, db_session: AsyncSession):
         repo = NotesRepository(db_session)
         note_data = NoteCreate(title="Test Note", content="Test Content")
 
-        result = repo.create(note_data)
+        result = await repo.create(note_data)
 
         assert isinstance(result, NoteResponse)
         assert result.title == "Test Note"
         assert result.content == "Test Content"
         assert result.id is not None
 
-        db_note = db_session.query(Note).filter(Note.id == result.id).first()
+        db_note = await db_session.get(Note, result.id)
         assert db_note is not None
         assert db_note.title == "Test Note"
 
-    def test_create_note_minimal(self, db_session: Session):
+    async def test_create_note_minimal(self, db_session: AsyncSession):
         repo = NotesRepository(db_session)
         note_data = NoteCreate(title="Minimal")
 
-        result = repo.create(note_data)
+        result = await repo.create(note_data)
 
         assert result.title == "Minimal"
         assert result.content == ""
 
 
 @pytest.mark.integration
-class TestNotesRepositoryGetAll:
-    def test_get_all_empty(self, db_session: Session):
+class TestNotesRepositoryGetAllJson:
+    async def test_get_all_json_empty(self, db_session: AsyncSession):
         repo = NotesRepository(db_session)
 
-        result = repo.get_all()
+        result = await repo.get_all_json()
 
-        assert result == []
+        assert result == b"[]"
 
-    def test_get_all_single(self, db_session: Session):
+    async def test_get_all_json_single(self, db_session: AsyncSession):
         note = Note(title="Test", content="Content")
         db_session.add(note)
-        db_session.commit()
+        await db_session.commit()
+        await db_session.refresh(note)
 
         repo = NotesRepository(db_session)
-        result = repo.get_all()
+        result = json.loads(await repo.get_all_json())
 
         assert len(result) == 1
-        assert result[0].title == "Test"
+        assert NoteResponse.model_validate(result[0]) == NoteResponse.model_validate(
+            note
+        )
 
-    def test_get_all_multiple(self, db_session: Session):
-        for i in range(5):
-            note = Note(title=f"Note {i}", content=f"Content {i}")
-            db_session.add(note)
-        db_session.commit()
+    async def test_get_all_json_multiple(self, db_session: AsyncSession):
+        await _seed_notes(db_session, 5)
 
         repo = NotesRepository(db_session)
-        result = repo.get_all()
+        result = json.loads(await repo.get_all_json())
 
         assert len(result) == 5
 
-    def test_get_all_pagination_skip(self, db_session: Session):
-        for i in range(5):
-            note = Note(title=f"Note {i}", content=f"Content {i}")
-            db_session.add(note)
-        db_session.commit()
+    async def test_get_all_json_pagination_skip(self, db_session: AsyncSession):
+        await _seed_notes(db_session, 5)
 
         repo = NotesRepository(db_session)
-        result = repo.get_all(skip=2)
+        result = json.loads(await repo.get_all_json(skip=2))
 
         assert len(result) == 3
 
-    def test_get_all_pagination_limit(self, db_session: Session):
-        for i in range(5):
-            note = Note(title=f"Note {i}", content=f"Content {i}")
-            db_session.add(note)
-        db_session.commit()
+    async def test_get_all_json_pagination_limit(self, db_session: AsyncSession):
+        await _seed_notes(db_session, 5)
 
         repo = NotesRepository(db_session)
-        result = repo.get_all(limit=2)
+        result = json.loads(await repo.get_all_json(limit=2))
 
         assert len(result) == 2
 
-    def test_get_all_pagination_both(self, db_session: Session):
-        for i in range(5):
-            note = Note(title=f"Note {i}", content=f"Content {i}")
-            db_session.add(note)
-        db_session.commit()
+    async def test_get_all_json_pagination_both(self, db_session: AsyncSession):
+        await _seed_notes(db_session, 5)
 
         repo = NotesRepository(db_session)
-        result = repo.get_all(skip=1, limit=2)
+        result = json.loads(await repo.get_all_json(skip=1, limit=2))
 
         assert len(result) == 2
 
 
 @pytest.mark.integration
 class TestNotesRepositoryGetById:
-    def test_get_by_id_success(self, db_session: Session):
+    async def test_get_by_id_success(self, db_session: AsyncSession):
         note = Note(title="Test", content="Content")
         db_session.add(note)
-        db_session.commit()
-        db_session.refresh(note)
+        await db_session.commit()
+        await db_session.refresh(note)
 
         repo = NotesRepository(db_session)
-        result = repo.get_by_id(note.id)
+        result = await repo.get_by_id(note.id)
 
         assert result is not None
         assert isinstance(result, NoteResponse)
         assert result.id == note.id
         assert result.title == "Test"
 
-    def test_get_by_id_not_found(self, db_session: Session):
+    async def test_get_by_id_not_found(self, db_session: AsyncSession):
         repo = NotesRepository(db_session)
-        result = repo.get_by_id(999)
+        result = await repo.get_by_id(999)
 
         assert result is None
 
 
 @pytest.mark.integration
 class TestNotesRepositoryUpdate:
-    def test_update_note_success(self, db_session: Session):
+    async def test_update_note_success(self, db_session: AsyncSession):
         note = Note(title="Original", content="Original Content")
         db_session.add(note)
-        db_session.commit()
-        db_session.refresh(note)
+        await db_session.commit()
+        await db_session.refresh(note)
 
         repo = NotesRepository(db_session)
         update_data = NoteUpdate(title="Updated", content="Updated Content")
-        result = repo.update(note.id, update_data)
+        result = await repo.update(note.id, update_data)
 
         assert result is not None
         assert result.title == "Updated"
         assert result.content == "Updated Content"
 
-        db_note = db_session.query(Note).filter(Note.id == note.id).first()
+        db_note = await db_session.get(Note, note.id)
         assert db_note.title == "Updated"
 
-    def test_update_note_partial_title(self, db_session: Session):
+    async def test_update_note_partial_title(self, db_session: AsyncSession):
         note = Note(title="Original", content="Original Content")
         db_session.add(note)
-        db_session.commit()
-        db_session.refresh(note)
+        await db_session.commit()
+        await db_session.refresh(note)
 
         repo = NotesRepository(db_session)
         update_data = NoteUpdate(title="Updated")
-        result = repo.update(note.id, update_data)
+        result = await repo.update(note.id, update_data)
 
         assert result is not None
         assert result.title == "Updated"
         assert result.content == "Original Content"
 
-    def test_update_note_partial_content(self, db_session: Session):
+    async def test_update_note_partial_content(self, db_session: AsyncSession):
         note = Note(title="Original", content="Original Content")
         db_session.add(note)
-        db_session.commit()
-        db_session.refresh(note)
+        await db_session.commit()
+        await db_session.refresh(note)
 
         repo = NotesRepository(db_session)
         update_data = NoteUpdate(content="Updated Content")
-        result = repo.update(note.id, update_data)
+        result = await repo.update(note.id, update_data)
 
         assert result is not None
         assert result.title == "Original"
         assert result.content == "Updated Content"
 
-    def test_update_note_empty(self, db_session: Session):
+    async def test_update_note_empty(self, db_session: AsyncSession):
         note = Note(title="Original", content="Original Content")
         db_session.add(note)
-        db_session.commit()
-        db_session.refresh(note)
+        await db_session.commit()
+        await db_session.refresh(note)
 
         repo = NotesRepository(db_session)
         update_data = NoteUpdate()
-        result = repo.update(note.id, update_data)
+        result = await repo.update(note.id, update_data)
 
         assert result is not None
         assert result.title == "Original"
         assert result.content == "Original Content"
 
-    def test_update_note_not_found(self, db_session: Session):
+    async def test_update_note_not_found(self, db_session: AsyncSession):
         repo = NotesRepository(db_session)
         update_data = NoteUpdate(title="Updated")
-        result = repo.update(999, update_data)
+        result = await repo.update(999, update_data)
 
         assert result is None
 
 
 @pytest.mark.integration
 class TestNotesRepositoryDelete:
-    def test_delete_note_success(self, db_session: Session):
+    async def test_delete_note_success(self, db_session: AsyncSession):
         note = Note(title="Test", content="Content")
         db_session.add(note)
-        db_session.commit()
-        db_session.refresh(note)
+        await db_session.commit()
+        await db_session.refresh(note)
         note_id = note.id
 
         repo = NotesRepository(db_session)
-        result = repo.delete(note_id)
+        result = await repo.delete(note_id)
 
         assert result is True
 
-        db_note = db_session.query(Note).filter(Note.id == note_id).first()
+        # Drop the identity map so get() has to go back to the database
+        db_session.expire_all()
+        db_note = await db_session.get(Note, note_id)
         assert db_note is None
 
-    def test_delete_note_not_found(self, db_session: Session):
+    async def test_delete_note_not_found(self, db_session: AsyncSession):
         repo = NotesRepository(db_session)
-        result = repo.delete(999)
+        result = await repo.delete(999)
 
         assert result is False
@@ -0,0 +1,43 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, create_autospec
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.models.note import Note
+from app.repositories.notes_repository import NotesRepository
+
+
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Autospeccing AsyncSession is slow, so build it once per run. Copies of a
+# mock share its child mocks, so the fixture resets and reuses this instance.
+_DB_SPEC = create_autospec(AsyncSession, instance=True)
+
+
+@pytest.fixture(scope="session")
+def now() -> datetime:
+    """Fixed timestamp for tests that do not care about the clock."""
+    return _NOW
+
+
+@pytest.fixture(scope="session")
+def note_template(now: datetime) -> Note:
+    """Canonical stored note shared by tests that only read it."""
+    return Note(
+        id=1,
+        title="Test Note",
+        content="Test Content",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def mock_db() -> AsyncMock:
+    _DB_SPEC.reset_mock(return_value=True, side_effect=True)
+    return _DB_SPEC
+
+
+@pytest.fixture
+def repo(mock_db: AsyncMock) -> NotesRepository:
+    return NotesRepository(mock_db)
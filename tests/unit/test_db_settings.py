@@ -0,0 +1,24 @@
+import pytest
+
+from app.config.db_settings import get_engine
+from app.config.env_settings import get_settings
+
+
+@pytest.mark.unit
+class TestGetEngine:
+    def test_engine_cached(self):
+        assert get_engine() is get_engine()
+
+    def test_cache_clear_uses_reloaded_settings(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("DB_HOST", "db.example.internal")
+        get_settings.cache_clear()
+        get_engine.cache_clear()
+        try:
+            engine = get_engine()
+
+            assert engine.url.host == "db.example.internal"
+            assert engine.url.drivername == "postgresql+psycopg"
+        finally:
+            monkeypatch.undo()
+            get_settings.cache_clear()
+            get_engine.cache_clear()
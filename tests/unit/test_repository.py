@@ -1,5 +1,6 @@
-from datetime import datetime
-from unittest.mock import Mock, patch
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -8,190 +9,177 @@ from app.schemas.note import NoteCreate, NoteUpdate, NoteResponse
 from app.repositories.models.note import Note
 
 
+# Request payloads are never mutated by the repository, so validate them once
+_NOTE_CREATE = NoteCreate(title="Test Note", content="Test Content")
+_NOTE_UPDATE_FULL = NoteUpdate(title="Updated", content="Updated Content")
+_NOTE_UPDATE_PARTIAL = NoteUpdate(title="Updated")
+
+
 @pytest.mark.unit
 class TestNotesRepositoryCreate:
-    def test_create_note_success(self):
+    async def test_create_note_success(
+        self, repo: NotesRepository, mock_db: AsyncMock, note_template: Note
+    ):
         # Arrange
-        mock_db = Mock()
-        now = datetime.now()
-        mock_note = Note(
-            id=1,
-            title="Test Note",
-            content="Test Content",
-            created_at=now,
-            updated_at=now,
+        mock_db.execute.return_value = Mock(
+            **{"scalar_one.return_value": note_template}
         )
-        mock_db.add = Mock()
-        mock_db.commit = Mock()
-        mock_db.refresh = Mock()
-
-        repo = NotesRepository(mock_db)
-        note_data = NoteCreate(title="Test Note", content="Test Content")
 
         # Act
-        with patch("app.repositories.notes_repository.Note", return_value=mock_note):
-            result = repo.create(note_data)
+        result = await repo.create(_NOTE_CREATE)
 
         # Assert
         assert isinstance(result, NoteResponse)
         assert result.title == "Test Note"
         assert result.content == "Test Content"
         assert result.id == 1
-        mock_db.add.assert_called_once()
+        stmt = mock_db.execute.call_args.args[0]
+        assert stmt.compile().params == {
+            "title": "Test Note",
+            "content": "Test Content",
+        }
         mock_db.commit.assert_called_once()
-        mock_db.refresh.assert_called_once()
-
-    def test_create_note_database_error(self):
-        # Arrange
-        mock_db = Mock()
-        mock_db.add = Mock()
-        mock_db.commit = Mock(side_effect=SQLAlchemyError("DB Error"))
-        mock_db.rollback = Mock()
-
-        repo = NotesRepository(mock_db)
-        note_data = NoteCreate(title="Test", content="Content")
-
-        # Act & Assert
-        with pytest.raises(SQLAlchemyError):
-            repo.create(note_data)
-
-        mock_db.rollback.assert_called_once()
+        mock_db.refresh.assert_not_called()
 
 
 @pytest.mark.unit
-class TestNotesRepositoryGetAll:
-    def test_get_all_empty(self):
+class TestNotesRepositoryGetAllJson:
+    async def test_get_all_json_empty(self, repo: NotesRepository, mock_db: AsyncMock):
         # Arrange
-        mock_db = Mock()
-        mock_scalars = Mock()
-        mock_scalars.all.return_value = []
-        mock_db.scalars.return_value = mock_scalars
-
-        repo = NotesRepository(mock_db)
+        mock_db.execute.return_value = Mock(**{"mappings.return_value": []})
 
         # Act
-        result = repo.get_all()
+        result = await repo.get_all_json()
 
         # Assert
-        assert result == []
-        mock_db.scalars.assert_called_once()
+        assert result == b"[]"
+        mock_db.execute.assert_called_once()
 
-    def test_get_all_with_pagination(self):
+    async def test_get_all_json_with_pagination(
+        self, repo: NotesRepository, mock_db: AsyncMock, now: datetime
+    ):
         # Arrange
-        mock_db = Mock()
-        mock_scalars = Mock()
-        now = datetime.now()
-        mock_notes = [
-            Note(
-                id=1,
-                title="Note 1",
-                content="Content 1",
-                created_at=now,
-                updated_at=now,
-            ),
-            Note(
-                id=2,
-                title="Note 2",
-                content="Content 2",
-                created_at=now,
-                updated_at=now,
-            ),
+        mock_rows = [
+            {
+                "id": 1,
+                "title": "Note 1",
+                "content": "Content 1",
+                "created_at": now,
+                "updated_at": now,
+            },
+            {
+                "id": 2,
+                "title": "Note 2",
+                "content": "Content 2",
+                "created_at": now,
+                "updated_at": now,
+            },
         ]
-        mock_scalars.all.return_value = mock_notes
-        mock_db.scalars.return_value = mock_scalars
-
-        repo = NotesRepository(mock_db)
+        mock_db.execute.return_value = Mock(**{"mappings.return_value": mock_rows})
 
         # Act
-        result = repo.get_all(skip=1, limit=2)
+        result = await repo.get_all_json(skip=1, limit=2)
 
         # Assert
-        assert len(result) == 2
-        assert all(isinstance(note, NoteResponse) for note in result)
-        mock_db.scalars.assert_called_once()
+        assert json.loads(result) == [
+            {
+                **row,
+                "created_at": "2024-01-01T12:00:00",
+                "updated_at": "2024-01-01T12:00:00",
+            }
+            for row in mock_rows
+        ]
+        mock_db.execute.assert_called_once()
+        assert mock_db.execute.call_args.args[1] == {"skip": 1, "limit": 2}
 
-    def test_get_all_database_error(self):
+    async def test_get_all_json_utc_suffix(
+        self, repo: NotesRepository, mock_db: AsyncMock
+    ):
         # Arrange
-        mock_db = Mock()
-        mock_db.scalars.side_effect = SQLAlchemyError("DB Error")
+        aware = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        row = {
+            "id": 1,
+            "title": "Note",
+            "content": "",
+            "created_at": aware,
+            "updated_at": aware,
+        }
+        mock_db.execute.return_value = Mock(**{"mappings.return_value": [row]})
 
-        repo = NotesRepository(mock_db)
+        # Act
+        result = await repo.get_all_json()
 
-        # Act & Assert
-        with pytest.raises(SQLAlchemyError):
-            repo.get_all()
+        # Assert
+        assert b'"created_at":"2024-01-01T12:00:00Z"' in result
 
 
 @pytest.mark.unit
 class TestNotesRepositoryGetById:
-    def test_get_by_id_success(self):
+    async def test_get_by_id_success(
+        self, repo: NotesRepository, mock_db: AsyncMock, note_template: Note
+    ):
         # Arrange
-        mock_db = Mock()
-        now = datetime.now()
-        mock_note = Note(
-            id=1, title="Test", content="Content", created_at=now, updated_at=now
-        )
-        mock_db.scalar.return_value = mock_note
-
-        repo = NotesRepository(mock_db)
+        mock_db.get.return_value = note_template
 
         # Act
-        result = repo.get_by_id(1)
+        result = await repo.get_by_id(1)
 
         # Assert
         assert result is not None
         assert isinstance(result, NoteResponse)
         assert result.id == 1
-        assert result.title == "Test"
-        mock_db.scalar.assert_called_once()
-
-    def test_get_by_id_not_found(self):
-        # Arrange
-        mock_db = Mock()
-        mock_db.scalar.return_value = None
-
-        repo = NotesRepository(mock_db)
-
-        # Act
-        result = repo.get_by_id(999)
-
-        # Assert
-        assert result is None
+        assert result.title == "Test Note"
+        mock_db.get.assert_called_once_with(Note, 1)
 
 
 @pytest.mark.unit
 class TestNotesRepositoryUpdate:
-    def test_update_note_success(self):
+    @pytest.mark.parametrize(
+        "update_data, expected_content",
+        [
+            (_NOTE_UPDATE_FULL, "Updated Content"),
+            (_NOTE_UPDATE_PARTIAL, "Original Content"),
+        ],
+        ids=["full", "partial"],
+    )
+    async def test_update_note(
+        self,
+        repo: NotesRepository,
+        mock_db: AsyncMock,
+        now: datetime,
+        update_data: NoteUpdate,
+        expected_content: str,
+    ):
         # Arrange
-        mock_db = Mock()
-        now = datetime.now()
         mock_note = Note(
             id=1,
-            title="Original",
-            content="Original Content",
+            title="Updated",
+            content=expected_content,
             created_at=now,
             updated_at=now,
         )
-        mock_db.scalar.return_value = mock_note
-
-        repo = NotesRepository(mock_db)
-        update_data = NoteUpdate(title="Updated", content="Updated Content")
+        mock_db.execute.return_value = Mock(
+            **{"scalar_one_or_none.return_value": mock_note}
+        )
 
         # Act
-        result = repo.update(1, update_data)
+        result = await repo.update(1, update_data)
 
         # Assert
-        assert result is not None
         assert isinstance(result, NoteResponse)
         assert result.title == "Updated"
-        assert result.content == "Updated Content"
+        assert result.content == expected_content
+        # Only fields sent by the client are written
+        params = mock_db.execute.call_args.args[0].compile().params
+        assert ("content" in params) == ("content" in update_data.model_fields_set)
+        mock_db.execute.assert_called_once()
         mock_db.commit.assert_called_once()
-        mock_db.refresh.assert_called_once()
+        mock_db.refresh.assert_not_called()
 
-    def test_update_note_partial(self):
+    async def test_update_note_empty_skips_update(
+        self, repo: NotesRepository, mock_db: AsyncMock, now: datetime
+    ):
         # Arrange
-        mock_db = Mock()
-        now = datetime.now()
         mock_note = Note(
             id=1,
             title="Original",
@@ -201,87 +189,89 @@ class TestNotesRepositoryUpdate:
         )
         mock_db.scalar.return_value = mock_note
 
-        repo = NotesRepository(mock_db)
-        update_data = NoteUpdate(title="Updated")
-
         # Act
-        result = repo.update(1, update_data)
+        result = await repo.update(1, NoteUpdate())
 
         # Assert
         assert result is not None
-        assert isinstance(result, NoteResponse)
-        assert result.title == "Updated"
-        assert result.content == "Original Content"
-        mock_db.commit.assert_called_once()
-        mock_db.refresh.assert_called_once()
-
-    def test_update_note_not_found(self):
-        # Arrange
-        mock_db = Mock()
-        mock_db.scalar.return_value = None
-
-        repo = NotesRepository(mock_db)
-        update_data = NoteUpdate(title="Updated")
-
-        # Act
-        result = repo.update(999, update_data)
-
-        # Assert
-        assert result is None
+        assert result.title == "Original"
+        mock_db.execute.assert_not_called()
         mock_db.commit.assert_not_called()
 
 
 @pytest.mark.unit
 class TestNotesRepositoryDelete:
-    def test_delete_note_success(self):
+    async def test_delete_note_success(self, repo: NotesRepository, mock_db: AsyncMock):
         # Arrange
-        mock_db = Mock()
-        now = datetime.now()
-        mock_note = Note(
-            id=1, title="Test", content="Content", created_at=now, updated_at=now
-        )
-        mock_db.scalar.return_value = mock_note
-
-        repo = NotesRepository(mock_db)
+        mock_db.execute.return_value = Mock(**{"scalar_one_or_none.return_value": 1})
 
         # Act
-        result = repo.delete(1)
+        result = await repo.delete(1)
 
         # Assert
         assert result is True
-        mock_db.delete.assert_called_once_with(mock_note)
+        mock_db.execute.assert_called_once()
+        mock_db.delete.assert_not_called()
         mock_db.commit.assert_called_once()
 
-    def test_delete_note_not_found(self):
-        # Arrange
-        mock_db = Mock()
-        mock_db.scalar.return_value = None
 
-        repo = NotesRepository(mock_db)
+@pytest.mark.unit
+class TestNotesRepositoryNotFound:
+    @pytest.mark.parametrize(
+        "operation, args, expected",
+        [
+            ("get_by_id", (999,), None),
+            ("update", (999, _NOTE_UPDATE_PARTIAL), None),
+            ("delete", (999,), False),
+        ],
+        ids=["get_by_id", "update", "delete"],
+    )
+    async def test_not_found(
+        self,
+        repo: NotesRepository,
+        mock_db: AsyncMock,
+        operation: str,
+        args: tuple[object, ...],
+        expected: object,
+    ):
+        # Arrange
+        mock_db.get.return_value = None
+        mock_db.execute.return_value = Mock(**{"scalar_one_or_none.return_value": None})
 
         # Act
-        result = repo.delete(999)
+        result = await getattr(repo, operation)(*args)
 
         # Assert
-        assert result is False
-        mock_db.delete.assert_not_called()
+        assert result is expected
+        mock_db.commit.assert_not_called()
 
-    def test_delete_note_database_error(self):
-        # Arrange
-        mock_db = Mock()
-        now = datetime.now()
-        mock_note = Note(
-            id=1, title="Test", content="Content", created_at=now, updated_at=now
-        )
-        mock_db.scalar.return_value = mock_note
-        mock_db.delete = Mock()
-        mock_db.commit = Mock(side_effect=SQLAlchemyError("DB Error"))
-        mock_db.rollback = Mock()
 
-        repo = NotesRepository(mock_db)
+@pytest.mark.unit
+class TestNotesRepositoryDatabaseErrors:
+    @pytest.mark.parametrize(
+        "operation, args, failing_call, rolls_back",
+        [
+            ("create", (_NOTE_CREATE,), "commit", True),
+            ("get_all_json", (), "execute", False),
+            ("delete", (1,), "commit", True),
+        ],
+        ids=["create", "get_all_json", "delete"],
+    )
+    async def test_database_error_is_reraised(
+        self,
+        repo: NotesRepository,
+        mock_db: AsyncMock,
+        operation: str,
+        args: tuple[object, ...],
+        failing_call: str,
+        rolls_back: bool,
+    ):
+        # Arrange
+        mock_db.execute.return_value = Mock()
+        getattr(mock_db, failing_call).side_effect = SQLAlchemyError("DB Error")
 
         # Act & Assert
         with pytest.raises(SQLAlchemyError):
-            repo.delete(1)
+            await getattr(repo, operation)(*args)
 
-        mock_db.rollback.assert_called_once()
+        assert mock_db.rollback.await_count == (1 if rolls_back else 0)
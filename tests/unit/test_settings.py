@@ -0,0 +1,27 @@
+import pytest
+
+from app.config.env_settings import Settings, get_settings
+
+
+@pytest.mark.unit
+class TestGetSettings:
+    def test_settings_cached(self):
+        assert get_settings() is get_settings()
+
+    def test_cache_clear_reloads(self, monkeypatch: pytest.MonkeyPatch):
+        original = get_settings()
+        monkeypatch.setenv("HEALTH_CACHE_TTL", "5")
+        get_settings.cache_clear()
+        try:
+            reloaded = get_settings()
+
+            assert reloaded is not original
+            assert reloaded.HEALTH_CACHE_TTL == 5
+        finally:
+            monkeypatch.undo()
+            get_settings.cache_clear()
+
+    def test_workers_default_single_process(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("WORKERS", raising=False)
+
+        assert Settings().WORKERS == 1